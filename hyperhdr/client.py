@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import asyncio
-import collections
 import collections.abc
 import copy
 import functools
@@ -11,6 +10,7 @@ import json
 import logging
 import random
 import string
+import sys
 import threading
 from types import TracebackType
 
@@ -31,11 +31,98 @@ from hyperhdr import const
 
 _LOGGER = logging.getLogger(__name__)
 
+# Use orjson for the wire encoding when it is installed, otherwise fall back to
+# the standard library. Both produce key sorted output.
+try:
+    # pylint: disable=no-member
+    import orjson
+
+    def _json_encode(data: Any) -> bytes:
+        """Serialize data to key sorted JSON."""
+        # Annotated rather than cast: orjson.dumps is Any when orjson is not
+        # installed, but already typed (making a cast redundant) when it is.
+        encoded: bytes = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        return encoded
+
+    _json_decode: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+
+    def _json_encode(data: Any) -> bytes:
+        """Serialize data to key sorted JSON."""
+        return json.dumps(data, sort_keys=True).encode("UTF-8")
+
+    _json_decode = json.loads
+
 HyperHDRCallback = Union[
     Callable[[Dict[str, Any]], Awaitable[None]],
     Callable[[Dict[str, Any]], None],
 ]
 
+# Composite command strings, built once rather than on every message.
+_CMD_ADJUSTMENT_UPDATE = f"{const.KEY_ADJUSTMENT}-{const.KEY_UPDATE}"
+_CMD_COMPONENTS_UPDATE = f"{const.KEY_COMPONENTS}-{const.KEY_UPDATE}"
+_CMD_EFFECTS_UPDATE = f"{const.KEY_EFFECTS}-{const.KEY_UPDATE}"
+_CMD_LEDS_UPDATE = f"{const.KEY_LEDS}-{const.KEY_UPDATE}"
+_CMD_LED_MAPPING_UPDATE = f"{const.KEY_LED_MAPPING}-{const.KEY_UPDATE}"
+_CMD_INSTANCE_UPDATE = f"{const.KEY_INSTANCE}-{const.KEY_UPDATE}"
+_CMD_PRIORITIES_UPDATE = f"{const.KEY_PRIORITIES}-{const.KEY_UPDATE}"
+_CMD_SESSIONS_UPDATE = f"{const.KEY_SESSIONS}-{const.KEY_UPDATE}"
+_CMD_VIDEOMODE_UPDATE = f"{const.KEY_VIDEOMODE}-{const.KEY_UPDATE}"
+_CMD_CLIENT_UPDATE = f"{const.KEY_CLIENT}-{const.KEY_UPDATE}"
+_CMD_INSTANCE_SWITCH_TO = f"{const.KEY_INSTANCE}-{const.KEY_SWITCH_TO}"
+
+# Alphabet for the IDs that correlate token requests with their responses.
+_AUTH_ID_CHARS = string.ascii_letters + string.digits
+
+# Fixed ("hard") request fields for the frequently sent control commands, built
+# once rather than on every call. Shared by all clients: _set_data only reads them.
+_SET_COLOR_HARD = {const.KEY_COMMAND: const.KEY_COLOR}
+_SET_COMPONENT_HARD = {const.KEY_COMMAND: const.KEY_COMPONENTSTATE}
+_SET_EFFECT_HARD = {const.KEY_COMMAND: const.KEY_EFFECT}
+_SET_IMAGE_HARD = {const.KEY_COMMAND: const.KEY_IMAGE}
+
+# Updates subscribed to alongside every serverinfo request.
+_SERVERINFO_SUBSCRIPTIONS = (
+    _CMD_ADJUSTMENT_UPDATE,
+    _CMD_COMPONENTS_UPDATE,
+    _CMD_EFFECTS_UPDATE,
+    _CMD_LEDS_UPDATE,
+    _CMD_LED_MAPPING_UPDATE,
+    _CMD_INSTANCE_UPDATE,
+    _CMD_PRIORITIES_UPDATE,
+    _CMD_SESSIONS_UPDATE,
+    _CMD_VIDEOMODE_UPDATE,
+)
+
+
+def _build_serverinfo_request_template() -> bytes | None:
+    """Return the serverinfo request as _async_send_json would send it.
+
+    Only the tan is left to fill in (with '%'). This relies on 'tan' sorting last
+    amongst the keys and the encoder emitting its value as the final '0}', so the
+    template is checked against the encoder and None is returned if they differ.
+    """
+
+    def encode(tan: int) -> bytes:
+        """Encode the serverinfo request for a tan."""
+        return _json_encode(
+            {
+                const.KEY_COMMAND: const.KEY_SERVERINFO,
+                const.KEY_SUBSCRIBE: _SERVERINFO_SUBSCRIPTIONS,
+                const.KEY_TAN: tan,
+            }
+        )
+
+    prefix = encode(0)[: -len(b"0}")].replace(b"%", b"%%")
+    template = prefix + b"%d}\n"
+    for tan in (0, 12345):
+        if template % tan != encode(tan) + b"\n":
+            return None
+    return template
+
+
+_SERVERINFO_REQUEST_TEMPLATE = _build_serverinfo_request_template()
+
 
 class HyperHDRError(Exception):
     """Baseclass for all HyperHDR exceptions."""
@@ -128,12 +215,10 @@ class HyperHDRClient:
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
 
-        # Start tan @ 1, as the zeroth tan is used by default.
-        self._tan_cv = asyncio.Condition()
+        # Start tan @ 1, as the zeroth tan is used by default. Each outstanding
+        # tan maps to a future that is resolved with the matching response.
         self._tan_counter = 1
-        self._tan_responses: dict[
-            int, dict[str, Any] | None
-        ] = collections.OrderedDict()
+        self._tan_responses: dict[int, asyncio.Future[dict[str, Any]]] = {}
 
         self._client_state: HyperHDRClientState = HyperHDRClientState(
             state={
@@ -382,7 +467,7 @@ class HyperHDRClient:
         data = HyperHDRClient._set_data(
             self._client_state.get_all(),
             hard={
-                const.KEY_COMMAND: f"{const.KEY_CLIENT}-{const.KEY_UPDATE}",
+                const.KEY_COMMAND: _CMD_CLIENT_UPDATE,
             },
         )
         await self._call_callbacks(str(data[const.KEY_COMMAND]), data)
@@ -453,13 +538,21 @@ class HyperHDRClient:
 
     async def _async_send_json(self, request: dict[str, Any]) -> bool:
         """Send JSON to the server."""
+        return await self._async_send_raw(_json_encode(request), b"\n")
+
+    async def _async_send_raw(self, *output: bytes) -> bool:
+        """Send a serialized request to the server.
+
+        The chunks are written together (without first being joined) and must
+        end with a newline.
+        """
         if not self._writer:
             return False
 
-        output = json.dumps(request, sort_keys=True).encode("UTF-8") + b"\n"
-        _LOGGER.debug("Send to server (%s): %s", self._host_port, output)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Send to server (%s): %s", self._host_port, b"".join(output))
         try:
-            self._writer.write(output)
+            self._writer.writelines(output)
             await self._writer.drain()
         except ConnectionError as exc:
             _LOGGER.warning(
@@ -505,7 +598,7 @@ class HyperHDRClient:
         _LOGGER.debug("Read from server (%s): %s", self._host_port, resp)
 
         try:
-            resp_json = json.loads(resp)
+            resp_json = _json_decode(resp)
         except json.decoder.JSONDecodeError:
             _LOGGER.warning(
                 "Could not decode JSON from HyperHDR (%s), skipping...",
@@ -624,32 +717,20 @@ class HyperHDRClient:
                 _LOGGER.warning(
                     "Failed HyperHDR (%s) command: %s", self._host_port, resp_json
                 )
-        elif (
-            command == f"{const.KEY_COMPONENTS}-{const.KEY_UPDATE}"
-            and const.KEY_DATA in resp_json
-        ):
+        elif command == _CMD_COMPONENTS_UPDATE and const.KEY_DATA in resp_json:
             self._update_component(resp_json[const.KEY_DATA])
-        elif (
-            command == f"{const.KEY_ADJUSTMENT}-{const.KEY_UPDATE}"
-            and const.KEY_DATA in resp_json
-        ):
+        elif command == _CMD_ADJUSTMENT_UPDATE and const.KEY_DATA in resp_json:
             self._update_adjustment(resp_json[const.KEY_DATA])
-        elif (
-            command == f"{const.KEY_EFFECTS}-{const.KEY_UPDATE}"
-            and const.KEY_DATA in resp_json
-        ):
+        elif command == _CMD_EFFECTS_UPDATE and const.KEY_DATA in resp_json:
             self._update_effects(resp_json[const.KEY_DATA])
-        elif command == f"{const.KEY_PRIORITIES}-{const.KEY_UPDATE}":
+        elif command == _CMD_PRIORITIES_UPDATE:
             if const.KEY_PRIORITIES in resp_json.get(const.KEY_DATA, {}):
                 self._update_priorities(resp_json[const.KEY_DATA][const.KEY_PRIORITIES])
             if const.KEY_PRIORITIES_AUTOSELECT in resp_json.get(const.KEY_DATA, {}):
                 self._update_priorities_autoselect(
                     resp_json[const.KEY_DATA][const.KEY_PRIORITIES_AUTOSELECT]
                 )
-        elif (
-            command == f"{const.KEY_INSTANCE}-{const.KEY_UPDATE}"
-            and const.KEY_DATA in resp_json
-        ):
+        elif command == _CMD_INSTANCE_UPDATE and const.KEY_DATA in resp_json:
             # If instances are changed, and the current instance is not listed
             # in the new instance update, then the client should disconnect.
             instances = resp_json[const.KEY_DATA]
@@ -683,28 +764,23 @@ class HyperHDRClient:
                 resp_json[const.KEY_INFO][const.KEY_INSTANCE]
             )
         elif (
-            command == f"{const.KEY_LED_MAPPING}-{const.KEY_UPDATE}"
+            command == _CMD_LED_MAPPING_UPDATE
             and const.KEY_LED_MAPPING_TYPE in resp_json.get(const.KEY_DATA, {})
         ):
             self._update_led_mapping_type(
                 resp_json[const.KEY_DATA][const.KEY_LED_MAPPING_TYPE]
             )
-        elif (
-            command == f"{const.KEY_SESSIONS}-{const.KEY_UPDATE}"
-            and const.KEY_DATA in resp_json
-        ):
+        elif command == _CMD_SESSIONS_UPDATE and const.KEY_DATA in resp_json:
             self._update_sessions(resp_json[const.KEY_DATA])
-        elif (
-            command == f"{const.KEY_VIDEOMODE}-{const.KEY_UPDATE}"
-            and const.KEY_VIDEOMODE in resp_json.get(const.KEY_DATA, {})
+        elif command == _CMD_VIDEOMODE_UPDATE and const.KEY_VIDEOMODE in resp_json.get(
+            const.KEY_DATA, {}
         ):
             self._update_videomode(resp_json[const.KEY_DATA][const.KEY_VIDEOMODE])
-        elif (
-            command == f"{const.KEY_LEDS}-{const.KEY_UPDATE}"
-            and const.KEY_LEDS in resp_json.get(const.KEY_DATA, {})
+        elif command == _CMD_LEDS_UPDATE and const.KEY_LEDS in resp_json.get(
+            const.KEY_DATA, {}
         ):
             self._update_leds(resp_json[const.KEY_DATA][const.KEY_LEDS])
-        elif command == f"{const.KEY_AUTHORIZE_LOGOUT}":
+        elif command == const.KEY_AUTHORIZE_LOGOUT:
             await self.async_client_disconnect()
         elif ServerInfoResponseOK(resp_json):
             self._update_serverinfo(resp_json[const.KEY_INFO])
@@ -722,18 +798,17 @@ class HyperHDRClient:
 
         tan = resp_json.get(const.KEY_TAN)
         if tan is not None:
-            async with self._tan_cv:
-                if tan in self._tan_responses:
-                    self._tan_responses[tan] = resp_json
-                    self._tan_cv.notify_all()
-                # Note: The behavior is not perfect here, in cases of an older
-                # HyperHDR server and a malformed request. In that case, the
-                # server will return tan==0 (regardless of the input tan), and
-                # so the match here will fail. This will cause the callee to
-                # time out awaiting a response (or wait forever if not timeout
-                # is specified). This was addressed in:
-                #
-                # https://github.com/hyperhdr-project/hyperhdr.ng/issues/1001 .
+            future = self._tan_responses.get(tan)
+            if future is not None and not future.done():
+                future.set_result(resp_json)
+            # Note: The behavior is not perfect here, in cases of an older
+            # HyperHDR server and a malformed request. In that case, the
+            # server will return tan==0 (regardless of the input tan), and
+            # so the match here will fail. This will cause the callee to
+            # time out awaiting a response (or wait forever if not timeout
+            # is specified). This was addressed in:
+            #
+            # https://github.com/hyperhdr-project/hyperhdr.ng/issues/1001 .
 
     # ==================
     # || Helper calls ||
@@ -747,62 +822,50 @@ class HyperHDRClient:
     @classmethod
     def _set_data(
         cls,
-        data: dict[Any, Any],
-        hard: dict[Any, Any] | None = None,
-        soft: dict[Any, Any] | None = None,
+        data: Mapping[Any, Any],
+        hard: Mapping[Any, Any] | None = None,
+        soft: Mapping[Any, Any] | None = None,
     ) -> dict[Any, Any]:
-        """Override the data in the dictionary selectively."""
-        output = soft or {}
-        output.update(data)
-        output.update(hard or {})
-        return output
+        """Override the data in the dictionary selectively.
+
+        Returns a new dictionary; none of the arguments are modified.
+        """
+        return {**(soft or {}), **data, **(hard or {})}
 
     async def _reserve_tan_slot(self, tan: int | None = None) -> int:
         """Increment and return the next tan to use."""
-        async with self._tan_cv:
-            if tan is None:
-                # If tan is not specified, find the next available higher
-                # value.
-                while self._tan_counter in self._tan_responses:
-                    self._tan_counter += 1
-                tan = self._tan_counter
+        if tan is None:
+            # If tan is not specified, find the next available higher
+            # value.
+            while self._tan_counter in self._tan_responses:
                 self._tan_counter += 1
-            if tan in self._tan_responses:
-                raise HyperHDRClientTanNotAvailable(
-                    "Requested tan '%i' is not available in HyperHDR client (%s)"
-                    % (tan, self._host_port)
-                )
-            self._tan_responses[tan] = None
-            return tan
+            tan = self._tan_counter
+            self._tan_counter += 1
+        if tan in self._tan_responses:
+            raise HyperHDRClientTanNotAvailable(
+                "Requested tan '%i' is not available in HyperHDR client (%s)"
+                % (tan, self._host_port)
+            )
+        self._tan_responses[tan] = asyncio.get_running_loop().create_future()
+        return tan
 
     async def _remove_tan_slot(self, tan: int) -> None:
         """Remove a tan slot that is no longer required."""
-        async with self._tan_cv:
-            if tan in self._tan_responses:
-                del self._tan_responses[tan]
+        future = self._tan_responses.pop(tan, None)
+        if future is not None:
+            future.cancel()
 
     async def _wait_for_tan_response(
         self, tan: int, timeout_secs: float
     ) -> dict[str, Any] | None:
         """Wait for a response to arrive."""
-        await self._tan_cv.acquire()
+        future = self._tan_responses.get(tan)
+        if future is None:
+            return None
         try:
-            await asyncio.wait_for(
-                self._tan_cv.wait_for(lambda: self._tan_responses.get(tan) is not None),
-                timeout=timeout_secs,
-            )
-            return self._tan_responses[tan]
+            return await asyncio.wait_for(future, timeout=timeout_secs)
         except asyncio.TimeoutError:
-            pass
-        finally:
-            # This should not be necessary, this function should be able to use
-            # 'async with self._tan_cv', however this does not currently play nice
-            # with Python 3.7/3.8 when the wait_for is canceled or times out,
-            # (the condition lock is not reaquired before re-raising the exception).
-            # See: https://bugs.python.org/issue39032
-            if self._tan_cv.locked():
-                self._tan_cv.release()
-        return None
+            return None
 
     class AwaitResponseWrapper:
         """Wrapper an async *send* coroutine and await the response."""
@@ -1022,9 +1085,7 @@ class HyperHDRClient:
     async def async_send_set_color(self, *_: Any, **kwargs: Any) -> bool:
         """Request that a color be set."""
         data = HyperHDRClient._set_data(
-            kwargs,
-            hard={const.KEY_COMMAND: const.KEY_COLOR},
-            soft={const.KEY_ORIGIN: self._origin},
+            kwargs, hard=_SET_COLOR_HARD, soft={const.KEY_ORIGIN: self._origin}
         )
         return await self._async_send_json(data)
 
@@ -1066,9 +1127,7 @@ class HyperHDRClient:
 
     async def async_send_set_component(self, *_: Any, **kwargs: Any) -> bool:
         """Request that a color be set."""
-        data = HyperHDRClient._set_data(
-            kwargs, hard={const.KEY_COMMAND: const.KEY_COMPONENTSTATE}
-        )
+        data = HyperHDRClient._set_data(kwargs, hard=_SET_COMPONENT_HARD)
         return await self._async_send_json(data)
 
     async_set_component = AwaitResponseWrapper(async_send_set_component)
@@ -1120,9 +1179,7 @@ class HyperHDRClient:
     async def async_send_set_effect(self, *_: Any, **kwargs: Any) -> bool:
         """Request that an effect be set."""
         data = HyperHDRClient._set_data(
-            kwargs,
-            hard={const.KEY_COMMAND: const.KEY_EFFECT},
-            soft={const.KEY_ORIGIN: self._origin},
+            kwargs, hard=_SET_EFFECT_HARD, soft={const.KEY_ORIGIN: self._origin}
         )
         return await self._async_send_json(data)
 
@@ -1136,9 +1193,7 @@ class HyperHDRClient:
     async def async_send_set_image(self, *_: Any, **kwargs: Any) -> bool:
         """Request that an image be set."""
         data = HyperHDRClient._set_data(
-            kwargs,
-            hard={const.KEY_COMMAND: const.KEY_IMAGE},
-            soft={const.KEY_ORIGIN: self._origin},
+            kwargs, hard=_SET_IMAGE_HARD, soft={const.KEY_ORIGIN: self._origin}
         )
         return await self._async_send_json(data)
 
@@ -1408,21 +1463,20 @@ class HyperHDRClient:
         # Request full state ('serverinfo') and subscribe to relevant
         # future updates to keep this object state accurate without the need to
         # poll.
+        tan = kwargs.get(const.KEY_TAN)
+        if (
+            _SERVERINFO_REQUEST_TEMPLATE is not None
+            and kwargs.keys() == {const.KEY_TAN}
+            and isinstance(tan, int)
+            and not isinstance(tan, bool)
+        ):
+            return await self._async_send_raw(_SERVERINFO_REQUEST_TEMPLATE % tan)
+
         data = HyperHDRClient._set_data(
             kwargs,
             hard={
                 const.KEY_COMMAND: const.KEY_SERVERINFO,
-                const.KEY_SUBSCRIBE: [
-                    f"{const.KEY_ADJUSTMENT}-{const.KEY_UPDATE}",
-                    f"{const.KEY_COMPONENTS}-{const.KEY_UPDATE}",
-                    f"{const.KEY_EFFECTS}-{const.KEY_UPDATE}",
-                    f"{const.KEY_LEDS}-{const.KEY_UPDATE}",
-                    f"{const.KEY_LED_MAPPING}-{const.KEY_UPDATE}",
-                    f"{const.KEY_INSTANCE}-{const.KEY_UPDATE}",
-                    f"{const.KEY_PRIORITIES}-{const.KEY_UPDATE}",
-                    f"{const.KEY_SESSIONS}-{const.KEY_UPDATE}",
-                    f"{const.KEY_VIDEOMODE}-{const.KEY_UPDATE}",
-                ],
+                const.KEY_SUBSCRIBE: list(_SERVERINFO_SUBSCRIPTIONS),
             },
         )
         return await self._async_send_json(data)
@@ -1499,6 +1553,39 @@ class HyperHDRClient:
         return None
 
 
+# Async call and property names to proxy, per client class.
+_CLIENT_API_CACHE: dict[
+    type[HyperHDRClient], tuple[tuple[str, ...], tuple[str, ...]]
+] = {}
+
+
+def _get_client_api(
+    client_type: type[HyperHDRClient],
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Return the async call and property names to proxy for a client class.
+
+    Inspects the class rather than an instance, so no properties are evaluated, and
+    only once per class rather than for every threaded client.
+    """
+    cached = _CLIENT_API_CACHE.get(client_type)
+    if cached is not None:
+        return cached
+
+    async_names = tuple(
+        name
+        for name, _ in inspect.getmembers(client_type, inspect.iscoroutinefunction)
+        if name.startswith("async_")
+    )
+    property_names = tuple(
+        name
+        for name, _ in inspect.getmembers(
+            client_type, lambda o: isinstance(o, property)
+        )
+    )
+    _CLIENT_API_CACHE[client_type] = (async_names, property_names)
+    return async_names, property_names
+
+
 class ThreadedHyperHDRClient(threading.Thread):
     """HyperHDR Client that runs in a dedicated thread."""
 
@@ -1520,6 +1607,11 @@ class ThreadedHyperHDRClient(threading.Thread):
         """Initialize client."""
         super().__init__()
         self._loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        # Most calls marshalled onto this loop finish without suspending, so
+        # run new tasks eagerly where supported rather than via the scheduler.
+        if sys.version_info >= (3, 12):
+            # pylint: disable-next=no-member
+            self._loop.set_task_factory(asyncio.eager_task_factory)
         self._hyperhdr_client: HyperHDRClient | None = None
 
         self._client_init_call: Callable[[], HyperHDRClient] = lambda: HyperHDRClient(
@@ -1548,15 +1640,12 @@ class ThreadedHyperHDRClient(threading.Thread):
 
         self._hyperhdr_client = self._client_init_call()
 
-        for name, value in inspect.getmembers(
-            self._hyperhdr_client, inspect.iscoroutinefunction
-        ):
-            if name.startswith("async_"):
-                new_name = name[len("async_") :]
-                self._register_async_call(new_name, value)
-        for name, value in inspect.getmembers(
-            type(self._hyperhdr_client), lambda o: isinstance(o, property)
-        ):
+        async_names, property_names = _get_client_api(type(self._hyperhdr_client))
+        for name in async_names:
+            self._register_async_call(
+                name[len("async_") :], getattr(self._hyperhdr_client, name)
+            )
+        for name in property_names:
             self._copy_property(name)
 
     def _copy_property(self, name: str) -> None:
@@ -1606,16 +1695,20 @@ class ThreadedHyperHDRClient(threading.Thread):
 class ResponseOK:
     """Small wrapper class around a server response."""
 
+    # A wrapper is created for most received responses, skip the per-instance dict.
+    __slots__ = ("_response", "_cmd", "_validators")
+
     def __init__(
         self,
         response: dict[str, Any] | None,
         cmd: str | None = None,
-        validators: list[Callable[[dict[str, Any]], bool]] | None = None,
+        validators: Iterable[Callable[[dict[str, Any]], bool]] | None = None,
     ):
         """Initialize a Response object."""
         self._response = response
         self._cmd = cmd
-        self._validators = validators or []
+        # Materialized, as the validators are re-run on every truth test.
+        self._validators = tuple(validators or ())
 
     def __bool__(self) -> bool:
         """Determine if the response indicates success."""
@@ -1636,18 +1729,22 @@ class ResponseOK:
 class ServerInfoResponseOK(ResponseOK):
     """Wrapper class for ServerInfo responses."""
 
+    __slots__ = ()
+
+    _VALIDATORS = (lambda r: bool(r.get(const.KEY_INFO)),)
+
     def __init__(self, response: dict[str, Any] | None):
         """Initialize the wrapper class."""
         super().__init__(
-            response,
-            cmd=const.KEY_SERVERINFO,
-            validators=[lambda r: bool(r.get(const.KEY_INFO))],
+            response, cmd=const.KEY_SERVERINFO, validators=self._VALIDATORS
         )
 
 
 class LoginResponseOK(ResponseOK):
     """Wrapper class for LoginResponse."""
 
+    __slots__ = ()
+
     def __init__(self, response: dict[str, Any] | None):
         """Initialize the wrapper class."""
         super().__init__(response, cmd=const.KEY_AUTHORIZE_LOGIN)
@@ -1656,19 +1753,23 @@ class LoginResponseOK(ResponseOK):
 class SwitchInstanceResponseOK(ResponseOK):
     """Wrapper class for SwitchInstanceResponse."""
 
+    __slots__ = ()
+
+    _VALIDATORS = (
+        lambda r: r.get(const.KEY_INFO, {}).get(const.KEY_INSTANCE) is not None,
+    )
+
     def __init__(self, response: dict[str, Any] | None):
         """Initialize the wrapper class."""
         super().__init__(
-            response,
-            cmd=f"{const.KEY_INSTANCE}-{const.KEY_SWITCH_TO}",
-            validators=[
-                lambda r: r.get(const.KEY_INFO, {}).get(const.KEY_INSTANCE) is not None
-            ],
+            response, cmd=_CMD_INSTANCE_SWITCH_TO, validators=self._VALIDATORS
         )
 
 
 def generate_random_auth_id() -> str:
-    """Generate random authenticate ID."""
-    return "".join(
-        random.choice(string.ascii_letters + string.digits) for i in range(0, 5)
-    )
+    """Generate random authenticate ID.
+
+    The ID only correlates a token request with its response, it is not a secret,
+    so the non-cryptographic PRNG is sufficient.
+    """
+    return "".join(random.choices(_AUTH_ID_CHARS, k=5))
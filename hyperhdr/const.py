@@ -1,103 +1,141 @@
-#!/usr/bin/python
-"""HyperHDR Constants."""
-
-KEY_ACCEPT = "accept"
-KEY_ACTIVE = "active"
-KEY_ADJUSTMENT = "adjustment"
-KEY_AUTHORIZE = "authorize"
-KEY_AUTHORIZE_LOGIN = "authorize-login"
-KEY_AUTHORIZE_LOGOUT = "authorize-logout"
-KEY_BRIGHTNESS = "brightness"
-KEY_CLEAR = "clear"
-KEY_CLIENT = "client"
-KEY_COLOR = "color"
-KEY_COMMAND = "command"
-KEY_COMPONENT = "component"
-KEY_COMPONENTSTATE = "componentstate"
-KEY_COMPONENTS = "components"
-KEY_CONNECTION = "connection"
-KEY_CONNECTED = "connected"
-KEY_DATA = "data"
-KEY_EFFECT = "effect"
-KEY_EFFECTS = "effects"
-KEY_ENABLED = "enabled"
-KEY_FRIENDLY_NAME = "friendly_name"
-KEY_HYPERHDR = "hyperhdr"
-KEY_LED_MAPPING = "imageToLedMapping"
-KEY_LED_MAPPING_TYPE = "imageToLedMappingType"
-KEY_ID = "id"
-KEY_IMAGE = "image"
-KEY_IMAGE_STREAM = "imagestream"
-KEY_IMAGE_STREAM_START = f"{KEY_IMAGE_STREAM}-start"
-KEY_IMAGE_STREAM_STOP = f"{KEY_IMAGE_STREAM}-stop"
-KEY_INFO = "info"
-KEY_INSTANCE = "instance"
-KEY_LEDCOLORS = "ledcolors"
-KEY_LED_STREAM_START = "ledstream-start"
-KEY_LED_STREAM_STOP = "ledstream-stop"
-KEY_LEDS = "leds"
-KEY_LED_MAPPING = "imageToLedMapping"
-KEY_LOADED_STATE = "loaded-state"
-KEY_LOGGED_IN = "logged-in"
-KEY_LOGIN = "login"
-KEY_LOGOUT = "logout"
-KEY_NAME = "name"
-KEY_ORIGIN = "origin"
-KEY_OWNER = "owner"
-KEY_PRIORITY = "priority"
-KEY_PRIORITIES = "priorities"
-KEY_PRIORITIES_AUTOSELECT = "priorities_autoselect"
-KEY_PROCESSING = "processing"
-KEY_RGB = "RGB"
-KEY_RESULT = "result"
-KEY_REQUIRED = "required"
-KEY_REQUEST_TOKEN = "requestToken"
-KEY_RUNNING = "running"
-KEY_SESSIONS = "sessions"
-KEY_SET_VIDEOMODE = "videoMode"
-KEY_SERVERINFO = "serverinfo"
-KEY_SOURCESELECT = "sourceselect"
-KEY_START_INSTANCE = "startInstance"
-KEY_STATE_LOADED = "startInstance"
-KEY_STOP_INSTANCE = "stopInstance"
-KEY_SUBCOMMAND = "subcommand"
-KEY_SUBSCRIBE = "subscribe"
-KEY_SUCCESS = "success"
-KEY_SWITCH_TO = "switchTo"
-KEY_STATE = "state"
-KEY_SYSINFO = "sysinfo"
-KEY_TAN = "tan"
-KEY_TIMEOUT_SECS = "timeout_secs"
-KEY_TOKEN = "token"
-KEY_TOKEN_REQUIRED = "tokenRequired"
-KEY_UPDATE = "update"
-KEY_VERSION = "version"
-KEY_VALUE = "value"
-KEY_VIDEOMODE = "videomode"
-KEY_VISIBLE = "visible"
-KEY_VIDEOMODES = ["2D", "3DSBS", "3DTAB"]
+"""HyperHDR Constants.
+
+Wire strings are interned and aliases (e.g. ``KEY_STATE_LOADED``) are bound to
+the canonical constant object, so ``is`` comparisons between constants are
+valid. Strings decoded from server JSON are not interned: compare those with
+``==``.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+from sys import intern as _i
+from types import MappingProxyType
+from typing import Final
+
+KEY_ACCEPT: Final[str] = _i("accept")
+KEY_ACTIVE: Final[str] = _i("active")
+KEY_ADJUSTMENT: Final[str] = _i("adjustment")
+KEY_AUTHORIZE: Final[str] = _i("authorize")
+KEY_AUTHORIZE_LOGIN: Final[str] = _i("authorize-login")
+KEY_AUTHORIZE_LOGOUT: Final[str] = _i("authorize-logout")
+KEY_BRIGHTNESS: Final[str] = _i("brightness")
+KEY_CLEAR: Final[str] = _i("clear")
+KEY_CLIENT: Final[str] = _i("client")
+KEY_COLOR: Final[str] = _i("color")
+KEY_COMMAND: Final[str] = _i("command")
+KEY_COMPONENT: Final[str] = _i("component")
+KEY_COMPONENTSTATE: Final[str] = _i("componentstate")
+KEY_COMPONENTS: Final[str] = _i("components")
+KEY_CONNECTION: Final[str] = _i("connection")
+KEY_CONNECTED: Final[str] = _i("connected")
+KEY_DATA: Final[str] = _i("data")
+KEY_EFFECT: Final[str] = _i("effect")
+KEY_EFFECTS: Final[str] = _i("effects")
+KEY_ENABLED: Final[str] = _i("enabled")
+KEY_FRIENDLY_NAME: Final[str] = _i("friendly_name")
+KEY_HYPERHDR: Final[str] = _i("hyperhdr")
+KEY_LED_MAPPING: Final[str] = _i("imageToLedMapping")
+KEY_LED_MAPPING_TYPE: Final[str] = _i("imageToLedMappingType")
+KEY_ID: Final[str] = _i("id")
+KEY_IMAGE: Final[str] = _i("image")
+KEY_IMAGE_STREAM: Final[str] = _i("imagestream")
+KEY_IMAGE_STREAM_START: Final[str] = _i(f"{KEY_IMAGE_STREAM}-start")
+KEY_IMAGE_STREAM_STOP: Final[str] = _i(f"{KEY_IMAGE_STREAM}-stop")
+KEY_INFO: Final[str] = _i("info")
+KEY_INSTANCE: Final[str] = _i("instance")
+KEY_LEDCOLORS: Final[str] = _i("ledcolors")
+KEY_LED_STREAM_START: Final[str] = _i("ledstream-start")
+KEY_LED_STREAM_STOP: Final[str] = _i("ledstream-stop")
+KEY_LEDS: Final[str] = _i("leds")
+KEY_LOADED_STATE: Final[str] = _i("loaded-state")
+KEY_LOGGED_IN: Final[str] = _i("logged-in")
+KEY_LOGIN: Final[str] = _i("login")
+KEY_LOGOUT: Final[str] = _i("logout")
+KEY_NAME: Final[str] = _i("name")
+KEY_ORIGIN: Final[str] = _i("origin")
+KEY_OWNER: Final[str] = _i("owner")
+KEY_PRIORITY: Final[str] = _i("priority")
+KEY_PRIORITIES: Final[str] = _i("priorities")
+KEY_PRIORITIES_AUTOSELECT: Final[str] = _i("priorities_autoselect")
+KEY_PROCESSING: Final[str] = _i("processing")
+KEY_RGB: Final[str] = _i("RGB")
+KEY_RESULT: Final[str] = _i("result")
+KEY_REQUIRED: Final[str] = _i("required")
+KEY_REQUEST_TOKEN: Final[str] = _i("requestToken")
+KEY_RUNNING: Final[str] = _i("running")
+KEY_SESSIONS: Final[str] = _i("sessions")
+KEY_SET_VIDEOMODE: Final[str] = _i("videoMode")
+KEY_SERVERINFO: Final[str] = _i("serverinfo")
+KEY_SOURCESELECT: Final[str] = _i("sourceselect")
+KEY_START_INSTANCE: Final[str] = _i("startInstance")
+# Unused by this package, retained for compatibility with its historical value.
+KEY_STATE_LOADED: Final[str] = KEY_START_INSTANCE
+KEY_STOP_INSTANCE: Final[str] = _i("stopInstance")
+KEY_SUBCOMMAND: Final[str] = _i("subcommand")
+KEY_SUBSCRIBE: Final[str] = _i("subscribe")
+KEY_SUCCESS: Final[str] = _i("success")
+KEY_SWITCH_TO: Final[str] = _i("switchTo")
+KEY_STATE: Final[str] = _i("state")
+KEY_SYSINFO: Final[str] = _i("sysinfo")
+KEY_TAN: Final[str] = _i("tan")
+KEY_TIMEOUT_SECS: Final[str] = _i("timeout_secs")
+KEY_TOKEN: Final[str] = _i("token")
+KEY_TOKEN_REQUIRED: Final[str] = _i("tokenRequired")
+KEY_UPDATE: Final[str] = _i("update")
+KEY_VERSION: Final[str] = _i("version")
+KEY_VALUE: Final[str] = _i("value")
+KEY_VIDEOMODE: Final[str] = _i("videomode")
+KEY_VISIBLE: Final[str] = _i("visible")
+KEY_VIDEOMODES: Final = (_i("2D"), _i("3DSBS"), _i("3DTAB"))
 
 # ComponentIDs from:
 # https://docs.hyperhdr-project.org/en/json/Control.html#components-ids-explained
-KEY_COMPONENTID = "componentId"
-KEY_COMPONENTID_ALL = "ALL"
-KEY_COMPONENTID_COLOR = "COLOR"
-KEY_COMPONENTID_EFFECT = "EFFECT"
-
-KEY_COMPONENTID_SMOOTHING = "SMOOTHING"
-KEY_COMPONENTID_BLACKBORDER = "BLACKBORDER"
-KEY_COMPONENTID_FORWARDER = "FORWARDER"
-KEY_COMPONENTID_BOBLIGHTSERVER = "BOBLIGHTSERVER"
-KEY_COMPONENTID_SYSTEMGRABBER = "SYSTEMGRABBER"
-KEY_COMPONENTID_LEDDEVICE = "LEDDEVICE"
-KEY_COMPONENTID_VIDEOGRABBER = "VIDEOGRABBER"
-KEY_COMPONENTID_HDR = "HDR"
-
-KEY_COMPONENTID_EXTERNAL_SOURCES = [
+KEY_COMPONENTID: Final[str] = _i("componentId")
+KEY_COMPONENTID_ALL: Final[str] = _i("ALL")
+KEY_COMPONENTID_COLOR: Final[str] = _i("COLOR")
+KEY_COMPONENTID_EFFECT: Final[str] = _i("EFFECT")
+
+KEY_COMPONENTID_SMOOTHING: Final[str] = _i("SMOOTHING")
+KEY_COMPONENTID_BLACKBORDER: Final[str] = _i("BLACKBORDER")
+KEY_COMPONENTID_FORWARDER: Final[str] = _i("FORWARDER")
+KEY_COMPONENTID_BOBLIGHTSERVER: Final[str] = _i("BOBLIGHTSERVER")
+KEY_COMPONENTID_SYSTEMGRABBER: Final[str] = _i("SYSTEMGRABBER")
+KEY_COMPONENTID_LEDDEVICE: Final[str] = _i("LEDDEVICE")
+KEY_COMPONENTID_VIDEOGRABBER: Final[str] = _i("VIDEOGRABBER")
+KEY_COMPONENTID_HDR: Final[str] = _i("HDR")
+
+
+class ComponentID(str, Enum):
+    """HyperHDR component ids; ComponentID(value) validates a wire string."""
+
+    ALL = KEY_COMPONENTID_ALL
+    COLOR = KEY_COMPONENTID_COLOR
+    EFFECT = KEY_COMPONENTID_EFFECT
+    SMOOTHING = KEY_COMPONENTID_SMOOTHING
+    BLACKBORDER = KEY_COMPONENTID_BLACKBORDER
+    FORWARDER = KEY_COMPONENTID_FORWARDER
+    BOBLIGHTSERVER = KEY_COMPONENTID_BOBLIGHTSERVER
+    SYSTEMGRABBER = KEY_COMPONENTID_SYSTEMGRABBER
+    LEDDEVICE = KEY_COMPONENTID_LEDDEVICE
+    VIDEOGRABBER = KEY_COMPONENTID_VIDEOGRABBER
+    HDR = KEY_COMPONENTID_HDR
+
+    def __str__(self) -> str:
+        """Return the wire string."""
+        return str(self.value)
+
+
+# Ordered, for callers presenting sources to users; the frozenset is intended for
+# membership tests.
+KEY_COMPONENTID_EXTERNAL_SOURCES: Final = (
     KEY_COMPONENTID_BOBLIGHTSERVER,
     KEY_COMPONENTID_SYSTEMGRABBER,
     KEY_COMPONENTID_VIDEOGRABBER,
-]
+)
+KEY_COMPONENTID_EXTERNAL_SOURCES_SET: Final = frozenset(
+    KEY_COMPONENTID_EXTERNAL_SOURCES
+)
 
 # Maps between HyperHDR API component names to HyperHDR UI names.
 KEY_COMPONENTID_TO_NAME = {
@@ -115,10 +153,31 @@ KEY_COMPONENTID_FROM_NAME = {
     name: component for component, name in KEY_COMPONENTID_TO_NAME.items()
 }
 
-DEFAULT_INSTANCE = 0
-DEFAULT_CONNECTION_RETRY_DELAY_SECS = 30
-DEFAULT_TIMEOUT_SECS = 5
-DEFAULT_REQUEST_TOKEN_TIMEOUT_SECS = 180
-DEFAULT_ORIGIN = "hyperhdr-py"
-DEFAULT_PORT_JSON = 19444
-DEFAULT_PORT_UI = 8090
+DEFAULT_INSTANCE: Final[int] = 0
+DEFAULT_CONNECTION_RETRY_DELAY_SECS: Final[int] = 30
+DEFAULT_TIMEOUT_SECS: Final[int] = 5
+DEFAULT_REQUEST_TOKEN_TIMEOUT_SECS: Final[int] = 180
+DEFAULT_ORIGIN: Final[str] = _i("hyperhdr-py")
+DEFAULT_PORT_JSON: Final[int] = 19444
+DEFAULT_PORT_UI: Final[int] = 8090
+
+# Read-only view of the scalar (str / int) KEY_* and DEFAULT_* constants, in
+# definition order. The collection constants are left out, as a mapping proxy
+# would still hand out the mutable ones (e.g. KEY_COMPONENTID_TO_NAME).
+CONSTS: Final = MappingProxyType(
+    {
+        name: value
+        for name, value in list(globals().items())
+        if name.startswith(("KEY_", "DEFAULT_")) and isinstance(value, (str, int))
+    }
+)
+
+__all__ = tuple(
+    sorted(
+        [name for name in list(globals()) if name.startswith(("KEY_", "DEFAULT_"))]
+        + [
+            "CONSTS",
+            "ComponentID",
+        ]
+    )
+)